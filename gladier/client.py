@@ -1,8 +1,10 @@
 import os
+import time
 import logging
 import hashlib
 import re
 import json
+import concurrent.futures
 from collections.abc import Iterable
 
 import fair_research_login
@@ -29,7 +31,33 @@ funcx_scope = getattr(FuncXClient, 'FUNCX_SCOPE',
 
 search_scope = 'urn:globus:auth:scope:search.api.globus.org:all'
 
-GLADIER_SCOPES = [
+# Automate statuses which mean a flow run is finished and will never change
+# again. CANCELED is included so a canceled run can't poll forever.
+TERMINAL_STATES = frozenset({'SUCCEEDED', 'FAILED', 'CANCELED'})
+
+# Serializing a funcx function for its checksum is relatively expensive, so one
+# serializer is shared for all checksums and results are cached per code object.
+funcx_serializer = FuncXSerializer()
+funcx_function_checksums = {}
+
+# Gladier checksums only detect local changes, they are not used for security.
+# Saying so lets OpenSSL skip FIPS-compliant code paths, but the keyword only
+# exists on python 3.9+
+try:
+    hashlib.sha256(b'', usedforsecurity=False)
+
+    def checksum_sha256(data):
+        return hashlib.sha256(data, usedforsecurity=False).hexdigest()
+except TypeError:
+    def checksum_sha256(data):
+        return hashlib.sha256(data).hexdigest()
+
+# Used to convert CamelCase class names into snake case config section names.
+# https://stackoverflow.com/questions/1175208/elegant-python-function-to-convert-camelcase-to-snake-case
+camel_to_snake_first = re.compile('(.)([A-Z][a-z]+)')
+camel_to_snake_second = re.compile('([a-z0-9])([A-Z])')
+
+GLADIER_SCOPES = (
     # FuncX requires search, auth, and its own funcx scope
     search_scope,
     'openid',
@@ -44,7 +72,7 @@ GLADIER_SCOPES = [
     # flow with the following:
     # mc = MyGladierClient()
     # gladier_scopes_plus_flow_scope = mc.scopes
-]
+)
 
 
 class GladierBaseClient(object):
@@ -71,24 +99,51 @@ class GladierBaseClient(object):
     globus_group = None
     subscription_id = None
 
+    # Slots keep per-instance attribute access fast and instances small. Subclasses
+    # typically only add class attributes (gladier_tools, flow_definition, etc), and
+    # any subclass which doesn't declare its own __slots__ gets a __dict__ as usual,
+    # so arbitrary instance attributes still work there.
+    __slots__ = (
+        'authorizers',
+        'auto_login',
+        'auto_registration',
+        '_public_config',
+        '_private_config',
+        '_tools',
+        '_flows_client',
+        '_funcx_client',
+        '_flow_definition_cache',
+        '_flow_definition_bytes',
+        '_flow_checksum_cache',
+        '_globus_group_urns',
+        '_flow_permissions',
+        '_scopes_cache',
+        '_private_section',
+        '_public_section',
+        '_default_input_cache',
+        '_registered_new_flow',
+    )
+
     def __init__(self, authorizers=None, auto_login=True, auto_registration=True):
-        self.__flows_client = None
-        self.__tools = None
-        self.public_config = self._load_public_config()
-        self.private_config = self._load_private_config()
+        self._flows_client = None
+        self._funcx_client = None
+        self._tools = None
+        self._flow_definition_cache = None
+        self._flow_definition_bytes = None
+        self._flow_checksum_cache = None
+        self._globus_group_urns = None
+        self._flow_permissions = None
+        self._scopes_cache = None
+        self._private_section = None
+        self._public_section = None
+        self._default_input_cache = None
+        self._registered_new_flow = False
+        self._public_config = None
+        self._private_config = None
         self.authorizers = authorizers or dict()
         self.auto_login = auto_login
         self.auto_registration = auto_registration
 
-        private_cfg = self.get_cfg(private=True)
-        private_cfg = gladier.utils.config_migrations.migrate_gladier(private_cfg)
-        private_cfg.save()
-
-        if os.path.exists(self.config_filename):
-            pub_cfg = self.get_cfg(private=False)
-            pub_cfg = gladier.utils.config_migrations.migrate_gladier(pub_cfg)
-            pub_cfg.save()
-
         if self.authorizers and self.auto_login:
             log.warning('Authorizers provided when "auto_login=True", you probably want to set '
                         'auto_login=False if you are providing your own authorizers...')
@@ -110,6 +165,28 @@ class GladierBaseClient(object):
         return gladier.config.GladierSecretsConfig(self.secret_config_filename,
                                                    self.section, self.client_id)
 
+    @property
+    def public_config(self):
+        """The public Gladier config, loaded and migrated lazily on first access.
+        Migration (and the write it implies) is skipped when the file doesn't exist."""
+        if self._public_config is None:
+            cfg = self._load_public_config()
+            if os.path.exists(self.config_filename):
+                cfg = gladier.utils.config_migrations.migrate_gladier(cfg)
+                cfg.save()
+            self._public_config = cfg
+        return self._public_config
+
+    @property
+    def private_config(self):
+        """The private Gladier config, loaded and migrated lazily on first access."""
+        if self._private_config is None:
+            cfg = self._load_private_config()
+            cfg = gladier.utils.config_migrations.migrate_gladier(cfg)
+            cfg.save()
+            self._private_config = cfg
+        return self._private_config
+
     @staticmethod
     def get_gladier_defaults_cls(tool_ref):
         """
@@ -145,11 +222,16 @@ class GladierBaseClient(object):
     @property
     def section(self):
         """Get the default section name for the config. The section name is derived
-        from the name of the user's flow_definition class turned snake case."""
+        from the name of the user's flow_definition class turned snake case. Since class
+        names never change at runtime, the name is computed once per class and cached."""
+        # Check __dict__ directly so a subclass never picks up a name cached on its parent
+        cached = self.__class__.__dict__.get('_section_name')
+        if cached is not None:
+            return cached
         name = self.__class__.__name__
-        # https://stackoverflow.com/questions/1175208/elegant-python-function-to-convert-camelcase-to-snake-case
-        snake_name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        snake_name = re.sub('([a-z0-9])([A-Z])', r'\1_\2', snake_name).lower()
+        snake_name = camel_to_snake_first.sub(r'\1_\2', name)
+        snake_name = camel_to_snake_second.sub(r'\1_\2', snake_name).lower()
+        self.__class__._section_name = snake_name
         return snake_name
 
     @property
@@ -159,15 +241,15 @@ class GladierBaseClient(object):
 
         :return: a list of subclassed instances of gladier.GladierBaseTool
         """
-        if getattr(self, '__tools', None):
-            return self.__tools
+        if self._tools is not None:
+            return self._tools
 
         if not getattr(self, 'gladier_tools', None) or not isinstance(self.gladier_tools, Iterable):
             raise gladier.exc.ConfigException(
                 '"gladier_tools" must be a defined list of Gladier Tools. '
                 'Ex: ["gladier.tools.hello_world.HelloWorld"]')
-        self.__tools = [self.get_gladier_defaults_cls(gt) for gt in self.gladier_tools]
-        return self.__tools
+        self._tools = [self.get_gladier_defaults_cls(gt) for gt in self.gladier_tools]
+        return self._tools
 
     def get_cfg(self, private=True):
         cfg = self.private_config if private is True else self.public_config
@@ -178,7 +260,15 @@ class GladierBaseClient(object):
         return cfg
 
     def get_section(self, private=True):
-        return self.get_cfg(private=private)[self.section]
+        # Section proxies are live views on the config, so they only need to be looked
+        # up once and writes through get_cfg() are still visible here.
+        if private is True:
+            if self._private_section is None:
+                self._private_section = self.get_cfg(private=True)[self.section]
+            return self._private_section
+        if self._public_section is None:
+            self._public_section = self.get_cfg(private=False)[self.section]
+        return self._public_section
 
     def get_native_client(self):
         """
@@ -204,30 +294,29 @@ class GladierBaseClient(object):
         is a flow configured in the local Gladier config file, otherwise it will
         only consist of basic scopes for running the funcx client/flows client/etc
 
-        :return: list of globus scopes required by this client
+        :return: tuple of globus scopes required by this client
         """
-        # Copy a list of the gladier scopes
-        gladier_scopes = GLADIER_SCOPES.copy()
+        if self._scopes_cache is not None:
+            return self._scopes_cache
         # Add a flow scope if one exists
         flow_scope = self.get_section(private=True).get('flow_scope')
-        if flow_scope:
-            gladier_scopes.append(flow_scope)
-        return gladier_scopes
+        self._scopes_cache = GLADIER_SCOPES + ((flow_scope,) if flow_scope else ())
+        return self._scopes_cache
 
     @property
     def missing_authorizers(self):
         """
         :return:  a list of Globus scopes for which there are no authorizers
         """
-        return [scope for scope in self.scopes if scope not in self.authorizers.keys()]
+        return [scope for scope in self.scopes if scope not in self.authorizers]
 
     @property
     def flows_client(self):
         """
         :return: an authorized Gloubs Automate Client
         """
-        if getattr(self, '__flows_client', None) is not None:
-            return self.__flows_client
+        if self._flows_client is not None:
+            return self._flows_client
         automate_authorizer = self.authorizers[
             globus_automate_client.flows_client.MANAGE_FLOWS_SCOPE
         ]
@@ -237,24 +326,24 @@ class GladierBaseClient(object):
         def get_flow_authorizer(*args, **kwargs):
             return flow_authorizer
 
-        self.__flows_client = globus_automate_client.FlowsClient.new_client(
+        self._flows_client = globus_automate_client.FlowsClient.new_client(
             self.client_id, get_flow_authorizer, automate_authorizer,
         )
-        return self.__flows_client
+        return self._flows_client
 
     @property
     def funcx_client(self):
         """
         :return: an authorized funcx client
         """
-        if getattr(self, '__funcx_client', None) is not None:
-            return self.__funcx_client
-        self.__funcx_client = FuncXClient(
+        if self._funcx_client is not None:
+            return self._funcx_client
+        self._funcx_client = FuncXClient(
             fx_authorizer=self.authorizers[funcx_scope],
             search_authorizer=self.authorizers[search_scope],
             openid_authorizer=self.authorizers['openid'],
         )
-        return self.__funcx_client
+        return self._funcx_client
 
     def login(self, **login_kwargs):
         """Login to the Gladier client. This will ensure the user has the correct
@@ -273,6 +362,23 @@ class GladierBaseClient(object):
         nc.login(**login_kwargs)
         self.authorizers = nc.get_authorizers_by_scope()
 
+    def _acquire_scope(self, scope):
+        """
+        Acquire an authorizer for a single scope without discarding the authorizers
+        already held for every other scope (login() replaces self.authorizers
+        wholesale). Falls back to a full login() if the scoped login fails.
+
+        :param scope: a single Globus scope to acquire an authorizer for
+        """
+        try:
+            nc = self.get_native_client()
+            nc.login(requested_scopes=[scope], refresh_tokens=True, force=True)
+            self.authorizers.update(nc.get_authorizers_by_scope())
+        except Exception:
+            log.debug(f'Scoped login for {scope} failed, falling back to full login',
+                      exc_info=True)
+            self.login(requested_scopes=[scope], force=True)
+
     def logout(self):
         """Log out and revoke this client's tokens. This object will no longer
         be usable until a new login is called.
@@ -296,31 +402,49 @@ class GladierBaseClient(object):
     def get_flow_definition(self):
         """
         Get the flow definition attached to this class. If the flow definition is an import string,
-        it will automatically load the import string and return the full flow.
+        it will automatically load the import string and return the full flow. The resolved
+        definition is cached on the instance, and only re-resolved after a flow is re-registered.
 
         :return: A dict of the Automate Flow definition
         """
+        if self._flow_definition_cache is not None:
+            return self._flow_definition_cache
+
         if not getattr(self, 'flow_definition', None):
             raise gladier.exc.ConfigException(f'"flow_definition" was not set on '
                                               f'{self.__class__.__name__}')
 
         if isinstance(self.flow_definition, dict):
-            return self.flow_definition
+            self._flow_definition_cache = self.flow_definition
         elif isinstance(self.flow_definition, str):
-            return self.get_gladier_defaults_cls(self.flow_definition).flow_definition
-        raise gladier.exc.ConfigException('"flow_definition" must be a dict or an import string '
-                                          'to a sub-class of type '
-                                          '"gladier.GladierBaseTool"')
-
-
+            self._flow_definition_cache = (
+                self.get_gladier_defaults_cls(self.flow_definition).flow_definition
+            )
+        else:
+            raise gladier.exc.ConfigException('"flow_definition" must be a dict or an import '
+                                              'string to a sub-class of type '
+                                              '"gladier.GladierBaseTool"')
+        return self._flow_definition_cache
+
+    def _get_flow_definition_bytes(self):
+        """Get a canonical (sorted keys, no whitespace) serialization of the flow
+        definition, serializing it at most once per registration cycle."""
+        if self._flow_definition_bytes is None:
+            self._flow_definition_bytes = json.dumps(self.get_flow_definition(), sort_keys=True,
+                                                     separators=(',', ':')).encode()
+        return self._flow_definition_bytes
 
     def get_flow_checksum(self):
         """
-        Get the SHA256 checksum of the current flow definition.
+        Get the SHA256 checksum of the current flow definition. The checksum is computed over
+        a canonical serialization of the flow definition and cached alongside it, so repeat
+        calls within a run don't re-serialize or re-hash the flow.
 
         :return: sha256 hex string of flow definition
         """
-        return hashlib.sha256(json.dumps(self.get_flow_definition()).encode()).hexdigest()
+        if self._flow_checksum_cache is None:
+            self._flow_checksum_cache = checksum_sha256(self._get_flow_definition_bytes())
+        return self._flow_checksum_cache
 
     @staticmethod
     def get_globus_urn(uuid, id_type='group'):
@@ -350,7 +474,9 @@ class GladierBaseClient(object):
         permission_type above to use the set client `globus_group`.
         """
         if identities is None and self.globus_group:
-            identities = [self.get_globus_urn(self.globus_group)]
+            if self._globus_group_urns is None:
+                self._globus_group_urns = [self.get_globus_urn(self.globus_group)]
+            identities = self._globus_group_urns
         permission_types = {
             'visible_to', 'runnable_by', 'administered_by', 'manage_by', 'monitor_by'
         }
@@ -359,6 +485,26 @@ class GladierBaseClient(object):
                                                    f'{permission_types}')
         return identities
 
+    def _get_flow_permissions(self):
+        """Resolve every supported permission type through get_flow_permission once per
+        instance, returning a dict of only the permission types that are set. Callers
+        slice out the types relevant to them."""
+        if self._flow_permissions is None:
+            permissions = {}
+            for p_type in ('visible_to', 'runnable_by', 'administered_by',
+                           'manage_by', 'monitor_by'):
+                permission = self.get_flow_permission(p_type)
+                if permission:
+                    permissions[p_type] = permission
+            self._flow_permissions = permissions
+        return self._flow_permissions
+
+    def invalidate_flow_permissions(self):
+        """Clear cached flow permissions. Only needed by subclasses which change
+        ``globus_group`` (or their ``get_flow_permission`` results) at runtime."""
+        self._flow_permissions = None
+        self._globus_group_urns = None
+
     @staticmethod
     def get_funcx_function_name(funcx_function):
         """
@@ -373,12 +519,20 @@ class GladierBaseClient(object):
     @staticmethod
     def get_funcx_function_checksum(funcx_function):
         """
-        Get the SHA256 checksum of a funcx function
+        Get the SHA256 checksum of a funcx function. Checksums are cached against the
+        function's code object, so each unique function is only serialized and hashed
+        once per process.
+
         :return: sha256 hex string of a given funcx function
         """
-        fxs = FuncXSerializer()
-        serialized_func = fxs.serialize(funcx_function).encode()
-        return hashlib.sha256(serialized_func).hexdigest()
+        code = getattr(funcx_function, '__code__', None)
+        checksum = funcx_function_checksums.get(code)
+        if checksum is None:
+            serialized_func = funcx_serializer.serialize(funcx_function).encode()
+            checksum = checksum_sha256(serialized_func)
+            if code is not None:
+                funcx_function_checksums[code] = checksum
+        return checksum
 
     def get_funcx_function_ids(self):
         """Get all funcx function ids for this run, registering them if there are no ids
@@ -391,6 +545,7 @@ class GladierBaseClient(object):
         :returns: a dict of function ids where keys are names and values are funcX function ids.
         """
         funcx_ids = dict()
+        unregistered = []
         for tool in self.tools:
             log.debug(f'Checking functions for {tool}')
             funcx_funcs = getattr(tool, 'funcx_functions', [])
@@ -423,22 +578,53 @@ class GladierBaseClient(object):
                 except (gladier.exc.RegistrationException, gladier.exc.FunctionObsolete):
                     if self.auto_registration is True:
                         log.info(f'Registering function {fid_name}')
-                        self.register_funcx_function(func)
-                        funcx_ids[fid_name] = cfgs[fid_name]
+                        unregistered.append(func)
                     else:
                         raise
+        if unregistered:
+            funcx_ids.update(self.register_funcx_functions(unregistered))
         return funcx_ids
 
     def register_funcx_function(self, function):
         """Register the functions with funcx. Ids are saved in the local gladier.cfg"""
+        return self.register_funcx_functions([function])
 
+    def _set_funcx_function(self, cfg, function, funcx_id):
+        """Set the id and checksum for a registered funcx function in the given config,
+        WITHOUT saving it. Saving is left to the caller, so a batch of registrations
+        results in a single config write.
+
+        :returns: the config name for the funcx function id
+        """
         fxid_name = gladier.utils.name_generation.get_funcx_function_name(function)
         fxck_name = gladier.utils.name_generation.get_funcx_function_checksum_name(function)
-        cfg = self.get_cfg(private=True)
-        cfg[self.section][fxid_name] = self.funcx_client.register_function(function,
-                                                                           function.__doc__)
+        cfg[self.section][fxid_name] = funcx_id
         cfg[self.section][fxck_name] = self.get_funcx_function_checksum(function)
+        return fxid_name
+
+    def register_funcx_functions(self, functions):
+        """Register several functions with funcx. Each registration is an independent
+        HTTPS round trip, so registrations are overlapped with a thread pool. Ids and
+        checksums are saved in the local gladier.cfg with one write once every
+        registration finishes.
+
+        :param functions: a list of funcx functions to register
+        :returns: a dict of function id names to funcX function ids
+        """
+        cfg = self.get_cfg(private=True)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            funcx_ids = list(executor.map(
+                lambda function: self.funcx_client.register_function(function,
+                                                                     function.__doc__),
+                functions))
+        registered = dict()
+        for function, funcx_id in zip(functions, funcx_ids):
+            fxid_name = self._set_funcx_function(cfg, function, funcx_id)
+            registered[fxid_name] = funcx_id
         cfg.save()
+        # Function ids are part of the default flow input, don't serve stale ones
+        self._default_input_cache = None
+        return registered
 
     def get_flow_id(self):
         """Get the current flow id for the current Gladier flow definiton.
@@ -450,12 +636,16 @@ class GladierBaseClient(object):
         """
         cfg_sec = self.get_section(private=True)
         flow_id, flow_scope = cfg_sec.get('flow_id'), cfg_sec.get('flow_scope')
+        stored_checksum = cfg_sec.get('flow_checksum')
         if not flow_id or not flow_scope:
             if self.auto_registration is False:
                 raise gladier.exc.NoFlowRegistered(
                     f'No flow registered for {self.config_filename} under section {self.section}')
             flow_id = self.register_flow()
-        elif cfg_sec.get('flow_checksum') != self.get_flow_checksum():
+        # Comparing against the cached checksum first skips re-hashing the flow
+        # entirely on repeat calls within a run
+        elif not stored_checksum or (stored_checksum != self._flow_checksum_cache
+                                     and stored_checksum != self.get_flow_checksum()):
             if self.auto_registration is False:
                 raise gladier.exc.FlowObsolete(
                     f'"flow_definition" on {self} has changed and needs to be re-registered.')
@@ -470,15 +660,20 @@ class GladierBaseClient(object):
         :raises: Automate exceptions on flow deployment.
         :return: an automate flow UUID
         """
+        # The flow definition may have changed since it was last cached, force the
+        # definition, its serialization and its checksum to be recomputed for
+        # (re)registration.
+        self._flow_definition_cache = None
+        self._flow_definition_bytes = None
+        self._flow_checksum_cache = None
         cfg = self.get_cfg()
 
         flow_id = cfg[self.section].get('flow_id')
         flow_definition = self.get_flow_definition()
-        flow_permissions = {
-            p_type: self.get_flow_permission(p_type)
-            for p_type in ['runnable_by', 'visible_to', 'administered_by']
-            if self.get_flow_permission(p_type)
-        }
+        permissions = self._get_flow_permissions()
+        flow_permissions = {p_type: permissions[p_type]
+                            for p_type in ('runnable_by', 'visible_to', 'administered_by')
+                            if p_type in permissions}
         log.debug(f'Flow permissions set to: {flow_permissions or "Flows defaults"}')
         flow_kwargs = flow_permissions
         # Input schema will be (probably is now) a required field. Returning {} is a temporary
@@ -506,6 +701,10 @@ class GladierBaseClient(object):
             cfg[self.section]['flow_scope'] = flow['globus_auth_scope']
             cfg[self.section]['flow_checksum'] = self.get_flow_checksum()
             cfg.save()
+            # A new deploy means a new flow scope, the cached scope list is stale and
+            # run_flow needs to recheck that the new scope is authorized
+            self._scopes_cache = None
+            self._registered_new_flow = True
             flow_id = cfg[self.section]['flow_id']
 
         return flow_id
@@ -523,6 +722,11 @@ class GladierBaseClient(object):
                  {'input': {'foo': 'bar'}}
         """
         flow_input = self.get_funcx_function_ids()
+        # Merge both private and public input variables up front, rather than indexing
+        # each config section once per tool and input key below.
+        # Note: Precedence starts and ends with: Public --> Private --> Default on Tool
+        overrides = {k: v for k, v in self.get_section(private=True).items() if v}
+        overrides.update({k: v for k, v in self.get_section(private=False).items() if v})
         for tool in self.tools:
             # conflicts = set(flow_input.keys()).intersection(set(tool.flow_input))
             # if conflicts:
@@ -532,17 +736,13 @@ class GladierBaseClient(object):
             #                 raise gladier.exc.ConfigException(
             #                   f'Conflict: Tools {tool} and {prev_tool} 'both define {r}')
             flow_input.update(tool.flow_input)
-            # Iterate over both private and public input variables, and include any relevant ones
-            # Note: Precedence starts and ends with: Public --> Private --> Default on Tool
             t_input, t_required = set(tool.flow_input), set(getattr(tool, 'required_input', []))
             input_keys = t_input.union(t_required)
             log.debug(f'{tool}: Looking for overrides for the following input keys: {input_keys}')
-            for cfg in (self.get_cfg(private=True), self.get_cfg(private=False)):
-                override_values = {k: cfg[self.section][k] for k in input_keys
-                                   if cfg[self.section].get(k)}
-                if override_values:
-                    log.info(f'Updates from {cfg.filename}: {list(override_values.keys())}')
-                    flow_input.update(override_values)
+            override_values = {k: overrides[k] for k in input_keys if k in overrides}
+            if override_values:
+                log.info(f'Config overrides for {tool}: {list(override_values.keys())}')
+                flow_input.update(override_values)
         return {'input': flow_input}
 
     def check_input(self, tool, flow_input):
@@ -586,7 +786,13 @@ class GladierBaseClient(object):
         :raises: gladier.exc.AuthException
         :raises: Any globus_sdk.exc.BaseException
         """
-        combine_flow_input = self.get_input() if use_defaults else dict()
+        if use_defaults:
+            if self._default_input_cache is None:
+                self._default_input_cache = self.get_input()
+            # Only the 'input' sub-dict is copied, it may be updated with user input below
+            combine_flow_input = {'input': dict(self._default_input_cache['input'])}
+        else:
+            combine_flow_input = {'input': dict()}
         if flow_input is not None:
             if not flow_input.get('input') or len(flow_input.keys()) != 1:
                 raise gladier.exc.ConfigException(
@@ -600,21 +806,23 @@ class GladierBaseClient(object):
                                             f'{self.missing_authorizers}')
         # When registering a flow for the first time, a special flow scope needs to be authorized
         # before the flow can begin. On first time runs, this requires an additional login.
+        # The recheck is only needed when get_flow_id actually deployed a new flow.
         flow_id = self.get_flow_id()
-        if not self.is_logged_in():
-            log.info(f'Missing authorizers: {self.missing_authorizers}, need additional login '
-                     f'to run flow.')
-            if self.auto_login is True:
-                self.login()
-            else:
-                raise gladier.exc.AuthException(
-                    f'Need {self.missing_authorizers} to run flow!', self.missing_authorizers)
-
-        flow_kwargs.update({
-            p_type: self.get_flow_permission(p_type)
-            for p_type in ['manage_by', 'monitor_by']
-            if self.get_flow_permission(p_type)
-        })
+        if self._registered_new_flow:
+            self._registered_new_flow = False
+            if not self.is_logged_in():
+                log.info(f'Missing authorizers: {self.missing_authorizers}, need additional login '
+                         f'to run flow.')
+                if self.auto_login is True:
+                    self.login()
+                else:
+                    raise gladier.exc.AuthException(
+                        f'Need {self.missing_authorizers} to run flow!', self.missing_authorizers)
+
+        permissions = self._get_flow_permissions()
+        for p_type in ('manage_by', 'monitor_by'):
+            if p_type in permissions:
+                flow_kwargs[p_type] = permissions[p_type]
         log.debug(f'Flow run permissions set to: {flow_kwargs or "Flows defaults"}')
         cfg_sec = self.get_section(private=True)
 
@@ -623,12 +831,13 @@ class GladierBaseClient(object):
                                               combine_flow_input, **flow_kwargs).data
         except globus_sdk.exc.GlobusAPIError as gapie:
             log.debug('Encountered error when running flow', exc_info=True)
-            automate_error_message = json.loads(gapie.message)
-            detail_message = automate_error_message['error']['detail']
-            if 'unable to get tokens for scopes' in detail_message:
+            # Check the raw message first, parsing out the json detail is only
+            # worthwhile for the one error actually handled here
+            if 'unable to get tokens for scopes' in (gapie.message or ''):
+                log.debug(f'Dependent scope change: {self._get_automate_error_detail(gapie)}')
                 if self.auto_login:
                     log.info('Initiating new login for dependent scope change')
-                    self.login(requested_scopes=[cfg_sec['flow_scope']], force=True)
+                    self._acquire_scope(cfg_sec['flow_scope'])
                     flow = self.flows_client.run_flow(flow_id, cfg_sec['flow_scope'],
                                                       combine_flow_input, **flow_kwargs).data
                 else:
@@ -644,19 +853,25 @@ class GladierBaseClient(object):
             raise gladier.exc.ConfigException(f'Flow Failed: {flow["details"]["description"]}')
         return flow
 
-    def get_status(self, action_id):
+    def get_status(self, action_id, flow_id=None, flow_scope=None):
         """
         Get the current status of the automate flow. Attempts to do additional work on funcx
         functions to deserialize any exception output.
 
         :param action_id: The globus action UUID used for this flow. The Automate flow id is
                           always the flow_id configured for this tool.
+        :param flow_id: The flow id for this client. Looked up automatically when not given,
+                        callers polling in a loop should pass it to skip repeat lookups.
+        :param flow_scope: The flow scope for this client. Looked up automatically (a config
+                           read) when not given, as with flow_id.
         :raises: Globus Automate exceptions from self.flows_client.flow_action_status
         :returns: a Globus Automate status object (with varying state structures)
         """
         try:
             status = self.flows_client.flow_action_status(
-                self.get_flow_id(), self.get_section(private=True)['flow_scope'], action_id
+                flow_id or self.get_flow_id(),
+                flow_scope or self.get_section(private=True)['flow_scope'],
+                action_id
             ).data
         except KeyError:
             raise gladier.exc.ConfigException('No Flow defined, register a flow')
@@ -666,27 +881,151 @@ class GladierBaseClient(object):
         except (KeyError, AttributeError):
             return status
 
+    def get_status_batch(self, action_ids, max_workers=16):
+        """
+        Get the current status for several flow actions at once. The flows API has no
+        batch status endpoint, so the per-action requests are fanned out with a thread
+        pool and collected into a single response. A failure fetching one action does
+        not fail the batch; the raised exception is recorded as that action's entry
+        instead.
+
+        :param action_ids: a list of globus action UUIDs run with this flow
+        :param max_workers: maximum number of concurrent status requests
+        :returns: a dict mapping each action id to its status object, or to the
+                  exception raised while fetching it
+        """
+        flow_id = self.get_flow_id()
+        flow_scope = self.get_section(private=True).get('flow_scope')
+        statuses = dict()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_status, action_id,
+                                flow_id=flow_id, flow_scope=flow_scope): action_id
+                for action_id in action_ids
+            }
+            for future in concurrent.futures.as_completed(futures):
+                action_id = futures[future]
+                try:
+                    statuses[action_id] = future.result()
+                except Exception as exc:
+                    log.debug(f'Fetching status for {action_id} raised', exc_info=True)
+                    statuses[action_id] = exc
+        return statuses
+
+    def progress_many(self, action_ids, callback=None, initial_delay=1, max_delay=30,
+                      backoff=1.5):
+        """
+        Poll several running flow actions together until all complete, batching each
+        round of status requests through get_status_batch and backing off between
+        rounds as in progress(). The callback is invoked with each changed status.
+        An action whose status fetch raises is dropped from polling, with the
+        exception recorded as its result.
+
+        :returns: a dict mapping each action id to its final status, or to the
+                  exception raised while fetching it
+        """
+        callback = callback or self._default_progress_callback
+        delay = initial_delay
+        finished = dict()
+        last_statuses = dict()
+        pending = list(action_ids)
+        while pending:
+            changed = False
+            for action_id, status in self.get_status_batch(pending).items():
+                if isinstance(status, Exception):
+                    finished[action_id] = status
+                    continue
+                if status != last_statuses.get(action_id):
+                    callback(status)
+                    last_statuses[action_id] = status
+                    changed = True
+                if status['status'] in TERMINAL_STATES:
+                    finished[action_id] = status
+            pending = [a for a in pending if a not in finished]
+            if not pending:
+                break
+            if changed:
+                delay = initial_delay
+            time.sleep(delay)
+            delay = min(delay * backoff, max_delay)
+        return finished
+
+    @staticmethod
+    def _get_automate_error_detail(gapie):
+        """Extract the 'detail' field from an automate style json error message,
+        falling back to the raw message when it isn't one."""
+        try:
+            return json.loads(gapie.message)['error']['detail']
+        except (TypeError, ValueError, KeyError):
+            return gapie.message
+
     @staticmethod
     def _default_progress_callback(response):
         if response['status'] == 'ACTIVE':
             print(f'[{response["status"]}]: {response["details"]["description"]}')
 
-    def progress(self, action_id, callback=None):
+    def progress(self, action_id, callback=None, initial_delay=1, max_delay=30, backoff=1.5):
         """
-        Continuously call self.get_status() until the flow completes. Each status response is
-        used as a parameter to the provided callback, by default will use the builtin callback
-        to print the current state to stdout.
+        Continuously poll self.get_status() until the flow completes, sleeping between
+        polls with exponential backoff so long running flows don't hammer the automate
+        service. Each status change is passed to the provided callback, by default the
+        builtin callback which prints the current state to stdout.
 
         :param action_id: The action id for a running flow. The flow is automatically pulled
                           based on the current tool's flow_definition.
-        :param callback: The function to call with the result from self.get_status. Must take
-                         a single parameter: mycallback(self.get_status())
+        :param callback: The function to call with each changed result from self.get_status.
+                         Must take a single parameter: mycallback(self.get_status())
+        :param initial_delay: Seconds to wait before the second poll. Also used again
+                              whenever the status changes
+        :param max_delay: Longest sleep (in seconds) between two polls
+        :param backoff: Multiplier applied to the delay after each unchanged poll
+        :returns: the final (terminal) status
         """
         callback = callback or self._default_progress_callback
-        status = self.get_status(action_id)
-        while status['status'] not in ['SUCCEEDED', 'FAILED']:
-            status = self.get_status(action_id)
-            callback(status)
+        return self.wait_for_completion(action_id, callback=callback,
+                                        initial_delay=initial_delay, max_delay=max_delay,
+                                        backoff=backoff)
+
+    def wait_for_completion(self, action_id, timeout=None, callback=None,
+                            initial_delay=1, max_delay=30, backoff=1.5):
+        """
+        Wait for a flow to reach a terminal state and return the final status. This is
+        the single place waiting happens, so if the flows service grows a server side
+        long-poll or streaming endpoint it can be dropped in here transparently for all
+        callers. Until then, the flow is polled with exponential backoff.
+
+        :param action_id: The action id for a running flow. The flow is automatically pulled
+                          based on the current tool's flow_definition.
+        :param timeout: Maximum seconds to wait for the flow to complete. None waits forever.
+        :param callback: An optional function called with each changed status response
+        :param initial_delay: Seconds to wait before the second poll. Also used again
+                              whenever the status changes
+        :param max_delay: Longest sleep (in seconds) between two polls
+        :param backoff: Multiplier applied to the delay after each unchanged poll
+        :raises gladier.exc.FlowTimeout: if the flow has not completed within ``timeout``
+        :returns: the final (terminal) status
+        """
+        delay = initial_delay
+        last_status = None
+        start = time.time()
+        # Resolve the flow id and scope once, rather than once per poll
+        flow_id = self.get_flow_id()
+        flow_scope = self.get_section(private=True).get('flow_scope')
+        while True:
+            status = self.get_status(action_id, flow_id=flow_id, flow_scope=flow_scope)
+            if status != last_status:
+                if callback is not None:
+                    callback(status)
+                last_status = status
+                delay = initial_delay
+            if status['status'] in TERMINAL_STATES:
+                return status
+            if timeout is not None and time.time() - start >= timeout:
+                raise gladier.exc.FlowTimeout(
+                    f'Flow action "{action_id}" still {status["status"]} '
+                    f'after {timeout} seconds')
+            time.sleep(delay)
+            delay = min(delay * backoff, max_delay)
 
     def get_details(self, action_id, state_name):
         """
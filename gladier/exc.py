@@ -49,6 +49,11 @@ class FunctionObsolete(ObsoleteException):
     pass
 
 
+class FlowTimeout(GladierException):
+    """A flow did not reach a terminal state within the allowed wait time"""
+    pass
+
+
 class FlowGenException(GladierException):
     """Something went wrong when auto-generating a flow"""
     pass
@@ -47,17 +47,29 @@ def test_run_flow(logged_in):
     cli.run_flow()
 
 
+def test_run_flow_without_defaults(logged_in):
+    cli = MockGladierClient()
+    flow_input = {'input': {'funcx_endpoint_non_compute': 'my_custom_endpoint_uuid'}}
+    cli.run_flow(flow_input=flow_input, use_defaults=False)
+
+
+def test_run_flow_without_defaults_missing_input(logged_in):
+    cli = MockGladierClient()
+    with pytest.raises(gladier.exc.ConfigException):
+        cli.run_flow(use_defaults=False)
+
+
 def test_dependent_scope_change_run_flow(logged_in, mock_flows_client,
                                          mock_dependent_token_change_error,
                                          monkeypatch):
     mock_flows_client.run_flow.side_effect = mock_dependent_token_change_error
     cli = MockGladierClient()
-    cli.login = Mock()
+    cli._acquire_scope = Mock()
 
-    # Gladier will re-run run_flow after login, so catch the second 'run_flow()'
+    # Gladier will re-run run_flow after re-auth, so catch the second 'run_flow()'
     with pytest.raises(mock_dependent_token_change_error):
         cli.run_flow()
-    assert cli.login.call_count == 1
+    assert cli._acquire_scope.call_count == 1
 
 
 def test_dependent_scope_change_no_login(logged_in, mock_flows_client,
@@ -81,9 +93,37 @@ def test_gladier_raises_globus_errors(logged_in, mock_flows_client, mock_globus_
         cli.run_flow()
 
 
-@pytest.mark.skip
-def test_progress():
-    pass
+def test_progress(logged_in, monkeypatch):
+    monkeypatch.setattr(gladier.client.time, 'sleep', Mock())
+    cli = MockGladierClient()
+    cli.get_status = Mock(side_effect=[
+        {'status': 'ACTIVE', 'details': {'description': 'state one'}},
+        {'status': 'ACTIVE', 'details': {'description': 'state one'}},
+        {'status': 'SUCCEEDED', 'details': {'description': 'all done'}},
+    ])
+    callback = Mock()
+    status = cli.progress('mock_action_id', callback=callback)
+    assert status['status'] == 'SUCCEEDED'
+    # The repeated identical status should not trigger a second callback
+    assert callback.call_count == 2
+
+
+def test_get_status_batch(logged_in):
+    cli = MockGladierClient()
+    cli.get_status = Mock(side_effect=lambda action_id, **kwargs: {
+        'status': 'ACTIVE', 'action_id': action_id,
+    })
+    statuses = cli.get_status_batch(['action_one', 'action_two'])
+    assert set(statuses) == {'action_one', 'action_two'}
+    assert statuses['action_one']['status'] == 'ACTIVE'
+
+
+def test_get_status_batch_isolates_errors(logged_in):
+    cli = MockGladierClient()
+    error = ValueError('mock status failure')
+    cli.get_status = Mock(side_effect=[{'status': 'ACTIVE'}, error])
+    statuses = cli.get_status_batch(['action_one', 'action_two'], max_workers=1)
+    assert statuses['action_two'] is error or statuses['action_one'] is error
 
 
 @pytest.mark.skip
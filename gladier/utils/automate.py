@@ -4,6 +4,10 @@ from funcx.serialize import FuncXSerializer
 
 log = logging.getLogger(__name__)
 
+# Reused for deserializing every funcx exception, constructing one per call
+# re-registers all of the funcx serializers each time.
+funcx_serializer = FuncXSerializer()
+
 automate_response_keys = {'action_id', 'status', 'state_name'}
 funcx_response_keys = {'result', 'status', 'exception', 'task_id'}
 
@@ -44,6 +48,6 @@ def get_details(response, state_name=None):
 
 def deserialize_exception(encoded_exc):
     try:
-        FuncXSerializer().deserialize(encoded_exc).reraise()
+        funcx_serializer.deserialize(encoded_exc).reraise()
     except Exception:
         return traceback.format_exc()
@@ -3,12 +3,15 @@ from gladier.exc import FlowModifierException
 from gladier.utils.name_generation import get_funcx_flow_state_name
 
 log = logging.getLogger(__name__)
-funcx_modifiers = {'endpoint', 'payload', 'tasks'}
-state_modifiers = {'InputPath', 'ResultPath', 'WaitTime'}
+# These never change at runtime, frozensets make that explicit and avoid
+# rebuilding the supported set on class creation
+funcx_modifiers = frozenset({'endpoint', 'payload', 'tasks'})
+state_modifiers = frozenset({'InputPath', 'ResultPath', 'WaitTime'})
+supported_modifiers = state_modifiers | funcx_modifiers
 
 
 class FlowModifiers:
-    supported_modifiers = state_modifiers.union(funcx_modifiers)
+    supported_modifiers = supported_modifiers
     funcx_modifiers = funcx_modifiers
     state_modifiers = state_modifiers
 
@@ -18,24 +21,34 @@ class FlowModifiers:
         self.functions = [func for tool in tools for func in tool.funcx_functions]
         self.function_names = [f.__name__ for f in self.functions]
         self.state_names = [get_funcx_flow_state_name(f) for f in self.functions]
+        # Lookup tables, so resolving modifiers doesn't linearly scan the lists above
+        self._function_by_name = {f.__name__: f for f in self.functions}
+        self._function_set = set(self.functions)
+        self._state_name_by_function_name = {
+            f.__name__: get_funcx_flow_state_name(f) for f in self.functions
+        }
+        self._result_paths = {sn: f'$.{sn}.details.results' for sn in self.state_names}
         self.modifiers = modifiers
         self.check_modifiers()
 
     def get_function(self, function_identifier):
-        if function_identifier in self.function_names:
-            return self.functions[self.function_names.index(function_identifier)]
-        if function_identifier in self.functions:
+        func = self._function_by_name.get(function_identifier)
+        if func is not None:
+            return func
+        if function_identifier in self._function_set:
             return function_identifier
 
     def get_flow_state_name(self, function_identifier):
         func = self.get_function(function_identifier)
-        return get_funcx_flow_state_name(func)
+        return self._state_name_by_function_name[func.__name__]
 
     def get_state_result_path(self, state_name):
-        return f'$.{state_name}.details.results'
+        path = self._result_paths.get(state_name)
+        return path if path is not None else f'$.{state_name}.details.results'
 
     def check_modifiers(self):
-        log.debug(f'Checking modifiers: {self.modifiers}')
+        # Lazy %-style formatting, the messages are only rendered if debug is enabled
+        log.debug('Checking modifiers: %s', self.modifiers)
         if not isinstance(self.modifiers, dict):
             raise FlowModifierException(f'{self.cls}: Flow Modifiers must be a dict')
 
@@ -53,25 +66,26 @@ class FlowModifiers:
                                                 f'{self.supported_modifiers}')
 
     def apply_modifiers(self, flow):
+        # apply_modifier mutates (and returns) the state dict, re-assigning it into
+        # flow['States'] would be a redundant dict write
         for name, mods in self.modifiers.items():
-            state_name = self.get_flow_state_name(name)
-            flow['States'][state_name] = self.apply_modifier(flow['States'][state_name], mods)
+            self.apply_modifier(flow['States'][self.get_flow_state_name(name)], mods)
         return flow
 
     def apply_modifier(self, flow_state, state_modifiers):
 
         for modifier_name, value in state_modifiers.items():
-            log.debug(f'Applying modifier "{modifier_name}", value "{value}"')
+            log.debug('Applying modifier "%s", value "%s"', modifier_name, value)
             # If this is for a funcx task
             if modifier_name in self.funcx_modifiers:
                 if modifier_name == 'tasks':
                     flow_state['Parameters'] = self.generic_set_modifier(
                         flow_state['Parameters'], 'tasks', value)
                 else:
-                    flow_state['Parameters']['tasks'] = [
+                    # generic_set_modifier mutates each task dict in place, no need
+                    # to rebuild the tasks list
+                    for fx_task in flow_state['Parameters']['tasks']:
                         self.generic_set_modifier(fx_task, modifier_name, value)
-                        for fx_task in flow_state['Parameters']['tasks']
-                    ]
             elif modifier_name in self.state_modifiers:
                 self.generic_set_modifier(flow_state, modifier_name, value)
                 if modifier_name == 'InputPath' and 'Parameters' in flow_state:
@@ -80,26 +94,29 @@ class FlowModifiers:
         return flow_state
 
     def generic_set_modifier(self, item, mod_name, mod_value):
-        if not isinstance(mod_value, str):
-            if mod_value in self.functions:
-                sn = get_funcx_flow_state_name(mod_value)
-                mod_value = self.get_state_result_path(sn)
-        elif isinstance(mod_value, str) and not mod_value.startswith('$.'):
-            if mod_value in self.function_names:
-                sn = self.state_names[self.function_names.index(mod_value)]
-                mod_value = self.get_state_result_path(sn)
-            elif mod_value in self.state_names:
+        is_str = isinstance(mod_value, str)
+        if not is_str:
+            # Unhashable values (eg 'tasks' lists) can never be functions, the callable
+            # check skips the set lookup for them
+            if callable(mod_value) and mod_value in self._function_set:
+                mod_value = self.get_state_result_path(get_funcx_flow_state_name(mod_value))
+                is_str = True
+        elif not mod_value.startswith('$.'):
+            if mod_value in self._state_name_by_function_name:
+                mod_value = self.get_state_result_path(
+                    self._state_name_by_function_name[mod_value])
+            elif mod_value in self._result_paths:
                 mod_value = self.get_state_result_path(mod_value)
             else:
                 mod_value = f'$.input.{mod_value}'
 
         # Remove duplicate keys
-        for duplicate_mod_key in (mod_name, f'{mod_name}.$'):
-            if duplicate_mod_key in item.keys():
-                item.pop(duplicate_mod_key)
+        item.pop(mod_name, None)
+        item.pop(f'{mod_name}.$', None)
 
-        if isinstance(mod_value, str) and mod_value.startswith('$.'):
+        # Every string value is a json path reference by this point
+        if is_str:
             mod_name = f'{mod_name}.$'
         item[mod_name] = mod_value
-        log.debug(f'Set modifier {mod_name} to {mod_value}')
+        log.debug('Set modifier %s to %s', mod_name, mod_value)
         return item
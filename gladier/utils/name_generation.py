@@ -1,3 +1,4 @@
+import functools
 
 
 def get_upper_camel_case(snake_case_name):
@@ -5,9 +6,11 @@ def get_upper_camel_case(snake_case_name):
     return ''.join([nb.capitalize() for nb in snake_case_name.split('_')])
 
 
+@functools.lru_cache(maxsize=None)
 def get_funcx_flow_state_name(funcx_function):
     """State names in Automate are typically upper camel case. This function generates
-    an upper case funcx function name for flow states."""
+    an upper case funcx function name for flow states. Results are memoized, flow
+    generation and modifiers ask for the same names repeatedly."""
     return get_upper_camel_case(funcx_function.__name__)
 
 